@@ -0,0 +1,11 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# agent_gemini.py is a top-level script, not an installed package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Importing it creates an OpenAI client and .agent_logs/ in the cwd
+os.environ.setdefault("OPENROUTER_API_KEY", "test")
+os.chdir(tempfile.mkdtemp(prefix="agent-tests-"))
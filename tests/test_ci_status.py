@@ -0,0 +1,49 @@
+import agent_gemini
+
+
+def check(name, state="completed", conclusion="success"):
+    return {"name": name, "state": state, "conclusion": conclusion, "detailsUrl": f"https://ci/{name}"}
+
+
+def test_skipped_fork_gated_job_counts_as_passed():
+    status = agent_gemini.summarize_checks([
+        check("build"),
+        check("detekt"),
+        check("ui_verification", conclusion="skipped"),
+    ])
+    assert status["all_passed"]
+    assert not status["any_failed"]
+    assert not status["pending"]
+
+
+def test_cancelled_and_timed_out_count_as_failed():
+    checks = [check("build", conclusion="cancelled"), check("test", conclusion="timed_out")]
+    status = agent_gemini.summarize_checks(checks)
+    assert status["any_failed"]
+    assert not status["all_passed"]
+    assert "build" in agent_gemini.format_failed_checks(checks)
+
+
+def test_waiting_check_is_pending():
+    status = agent_gemini.summarize_checks([check("build"), check("deploy", state="waiting", conclusion=None)])
+    assert status["pending"]
+    assert not status["all_passed"]
+
+
+def test_no_checks_is_pending():
+    status = agent_gemini.summarize_checks([])
+    assert status["pending"]
+    assert not status["all_passed"]
+
+
+def test_gh_pr_checks_buckets_are_normalized():
+    rows = [
+        {"name": "build", "state": "SUCCESS", "bucket": "pass", "link": "https://ci/build"},
+        {"name": "ui_verification", "state": "SKIPPED", "bucket": "skipping", "link": ""},
+        {"name": "detekt", "state": "FAILURE", "bucket": "fail", "link": "https://ci/detekt"},
+    ]
+    checks = agent_gemini.checks_from_buckets(rows)
+    status = agent_gemini.summarize_checks(checks)
+    assert status["any_failed"]
+    assert not status["pending"]
+    assert agent_gemini.format_failed_checks(checks) == "Failed CI checks:\n- detekt: https://ci/detekt"
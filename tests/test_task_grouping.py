@@ -0,0 +1,30 @@
+import agent_gemini
+
+
+def test_tasks_sharing_a_file_are_grouped():
+    groups = agent_gemini.group_independent_tasks([
+        (0, "Fix validation in LoginStore"),
+        (1, "Update README.md"),
+        (2, "Rename fields in LoginStore.kt"),
+    ])
+    assert groups == [
+        [(0, "Fix validation in LoginStore"), (2, "Rename fields in LoginStore.kt")],
+        [(1, "Update README.md")],
+    ]
+
+
+def test_abbreviations_are_not_file_names():
+    groups = agent_gemini.group_independent_tasks([
+        (0, "Add a loading state, e.g. a spinner"),
+        (1, "Tighten the theme colors, e.g. darker primary"),
+        (2, "Document it, i.e. and/or in the changelog"),
+    ])
+    assert len(groups) == 3
+
+
+def test_paths_with_separators_are_grouped():
+    groups = agent_gemini.group_independent_tasks([
+        (0, "Clean up composeApp/src/commonMain"),
+        (1, "Add tests under composeApp/src/commonMain"),
+    ])
+    assert len(groups) == 1
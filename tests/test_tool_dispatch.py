@@ -0,0 +1,29 @@
+import json
+from types import SimpleNamespace
+
+import agent_gemini
+
+
+def tool_call(call_id, name, **args):
+    return SimpleNamespace(id=call_id, function=SimpleNamespace(name=name, arguments=json.dumps(args)))
+
+
+def test_shell_calls_run_in_call_order(tmp_path):
+    out = tmp_path / "out.txt"
+    messages = agent_gemini.run_tool_calls([
+        tool_call("1", "run_shell", command=f"sleep 0.5; echo A >> {out}"),
+        tool_call("2", "run_shell", command=f"echo B >> {out}"),
+    ])
+    assert [m["tool_call_id"] for m in messages] == ["1", "2"]
+    assert out.read_text() == "A\nB\n"
+
+
+def test_read_after_write_sees_new_content(tmp_path):
+    path = tmp_path / "note.txt"
+    path.write_text("old")
+    messages = agent_gemini.run_tool_calls([
+        tool_call("1", "write_file", path=str(path), content="new"),
+        tool_call("2", "read_file", path=str(path)),
+        tool_call("3", "read_file", path=str(path)),
+    ])
+    assert [m["content"] for m in messages[1:]] == ["new", "new"]